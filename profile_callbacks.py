@@ -0,0 +1,64 @@
+"""Profile the server-side callbacks on the loaded registrations.
+
+    python profile_callbacks.py [--repeat N] [--output callbacks.prof]
+
+Prints the most expensive functions by cumulative time. With --output the raw
+profile is also written to disk for `snakeviz callbacks.prof`.
+"""
+import argparse
+import cProfile
+import pstats
+
+import plotly.io as pio
+
+import registrations as reg
+
+
+def scenarios():
+    """The default view plus a typical narrowed-down selection, per date field."""
+    narrowed = dict(
+        sel_years=reg.academic_years[-2:],
+        sel_degrees=reg.degree_types[:1],
+        sel_fields=reg.primary_fields[:3],
+        sel_countries=reg.countries[:5],
+        sel_tiers=[],
+    )
+    empty = dict(sel_years=[], sel_degrees=[], sel_fields=[], sel_countries=[], sel_tiers=[])
+    return [(date_field, filters)
+            for date_field in reg.DATE_FIELDS
+            for filters in (empty, narrowed)]
+
+
+def run_callbacks(date_field, sel_years, sel_degrees, sel_fields, sel_countries, sel_tiers):
+    # Bypass summarize_filters' memoization so every run does the real work.
+    filtered = reg.filter_data(reg.registration_data, sel_years, sel_degrees,
+                               sel_fields, sel_countries, sel_tiers, date_field)
+    summary = reg.summarize(filtered, date_field, sel_years)
+    # Dash serializes the store payload with this encoder on every response.
+    pio.json.to_json_plotly(summary)
+    reg.update_filter_stats(summary)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="write the raw profile to this file")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    print(f"{len(reg.registration_data):,} registrations loaded")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(args.repeat):
+        for date_field, filters in scenarios():
+            run_callbacks(date_field, **filters)
+    profiler.disable()
+
+    if args.output:
+        profiler.dump_stats(args.output)
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
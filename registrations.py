@@ -1,397 +1,620 @@
-from dash import Dash, html, dcc, Input, Output, callback
-import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
-import requests
-import dash_bootstrap_components as dbc
-from dash_bootstrap_templates import load_figure_template
-from flask import Flask
-
-# ==========================================================================
-# Constants
-# ==========================================================================
-
-API_URL = "https://support.econjobmarket.org/api/registrations"
-CUTOFF_DATE = "2021-06-01"
-ACADEMIC_YEAR_START_MONTH = 6
-
-ACADEMIC_MONTH_LABELS = [
-    "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
-    "Jan", "Feb", "Mar", "Apr", "May",
-]
-ACADEMIC_MONTH_DAYS = [0, 30, 61, 92, 122, 153, 183, 214, 245, 273, 304, 334]
-
-TRACE_COLORS = [
-    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
-    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
-]
-
-SIDEBAR_WIDTH = "18rem"
-
-# Maps the date field radio button value to the corresponding year column
-# and display label. Used throughout callbacks to avoid branching on
-# enrolldate vs date_last_login everywhere.
-DATE_FIELDS = {
-    "enrolldate": {"year_col": "academic_year", "label": "Enrollment Date"},
-    "date_last_login": {"year_col": "login_academic_year", "label": "Last Login Date"},
-}
-
-# ==========================================================================
-# Data
-# ==========================================================================
-
-def get_academic_year(date):
-    """Map a calendar date to its academic year (Jun-May cycle)."""
-    if date.month >= ACADEMIC_YEAR_START_MONTH:
-        return date.year
-    return date.year - 1
-
-
-def date_to_academic_days(date, academic_year):
-    """Days elapsed since June 1 of the given academic year."""
-    start = pd.Timestamp(year=int(academic_year), month=ACADEMIC_YEAR_START_MONTH, day=1)
-    return (date - start).days
-
-
-def unique_sorted(series):
-    """Sorted unique non-null values from a pandas Series."""
-    return sorted(x for x in series.unique() if x is not None and not pd.isna(x))
-
-
-def load_data():
-    r = requests.get(API_URL)
-    df = pd.DataFrame(r.json())
-
-    df["enrolldate"] = pd.to_datetime(df["enrolldate"])
-    df["date_last_login"] = pd.to_datetime(df["date_last_login"])
-
-    cutoff = pd.to_datetime(CUTOFF_DATE)
-    df = df[(df["enrolldate"] >= cutoff) & (df["date_last_login"] >= cutoff)]
-
-    df["academic_year"] = df["enrolldate"].apply(get_academic_year)
-    df["login_academic_year"] = df["date_last_login"].apply(get_academic_year)
-
-    return df
-
-
-registration_data = load_data()
-total_registrations = len(registration_data)
-
-primary_fields = unique_sorted(registration_data["primary_field"])
-countries = unique_sorted(registration_data["country"])
-tiers = unique_sorted(registration_data["tier"])
-degree_types = unique_sorted(registration_data["degreetype"])
-academic_years = unique_sorted(registration_data["academic_year"])
-login_academic_years = unique_sorted(registration_data["login_academic_year"])
-
-# ==========================================================================
-# Filtering and graph helpers
-# ==========================================================================
-
-def filter_data(data, selected_years, selected_degrees, selected_fields,
-                selected_countries, selected_tiers, date_field):
-    df = data.copy()
-    year_col = DATE_FIELDS[date_field]["year_col"]
-
-    for values, col in [
-        (selected_years, year_col),
-        (selected_degrees, "degreetype"),
-        (selected_fields, "primary_field"),
-        (selected_countries, "country"),
-        (selected_tiers, "tier"),
-    ]:
-        if values:
-            df = df[df[col].isin(values)]
-
-    return df
-
-
-def build_traces(df, date_field, year_col, years_to_show):
-    """Build one Scatter trace per academic year showing cumulative registrations."""
-    traces = []
-    for i, year in enumerate(years_to_show):
-        year_df = df[df[year_col] == year].copy()
-        if year_df.empty:
-            continue
-
-        year_df = year_df.sort_values(date_field).reset_index(drop=True)
-        year_df["cumcount"] = np.arange(1, len(year_df) + 1)
-
-        timeline = [date_to_academic_days(row[date_field], year)
-                     for _, row in year_df.iterrows()]
-
-        traces.append(go.Scatter(
-            x=timeline,
-            y=year_df["cumcount"],
-            name=f"{int(year)}-{int(year)+1}",
-            mode="lines+markers",
-            marker=dict(size=4),
-            line=dict(width=2, color=TRACE_COLORS[i % len(TRACE_COLORS)]),
-        ))
-
-    return traces
-
-
-def make_title(label, selected_years):
-    base = f"Cumulative Count by {label}"
-    if not selected_years:
-        return f"{base} - All Years"
-    if len(selected_years) == 1:
-        y = selected_years[0]
-        return f"{base} - {int(y)}-{int(y)+1}"
-    return f"{base} - Selected Years"
-
-
-def academic_xaxis():
-    return dict(
-        tickmode="array",
-        tickvals=ACADEMIC_MONTH_DAYS,
-        ticktext=ACADEMIC_MONTH_LABELS,
-        showgrid=True,
-        gridcolor="lightgray",
-        range=[0, 365],
-    )
-
-# ==========================================================================
-# Layout
-# ==========================================================================
-
-SIDEBAR_STYLE = {
-    "position": "fixed", "top": 0, "left": 0, "bottom": 0,
-    "width": SIDEBAR_WIDTH, "padding": "2rem 1rem",
-    "background-color": "#f8f9fa", "border-right": "1px solid #dee2e6",
-    "overflow-y": "auto",
-}
-
-CONTENT_STYLE = {
-    "margin-left": SIDEBAR_WIDTH, "margin-right": "2rem",
-    "padding": "2rem 1rem", "padding-bottom": "4rem",
-}
-
-FOOTER_STYLE = {
-    "position": "fixed", "left": SIDEBAR_WIDTH, "right": 0, "bottom": 0,
-    "height": "3rem", "background-color": "#f8f9fa",
-    "border-top": "1px solid #dee2e6", "padding": "0.5rem 2rem",
-    "display": "flex", "align-items": "center", "justify-content": "center",
-}
-
-load_figure_template("LUX")
-app_server = Flask(__name__)
-app = Dash(__name__, server=app_server, external_stylesheets=[dbc.themes.LUX])
-
-sidebar = html.Div([
-    html.H4("FILTERS", className="text-primary mb-4"),
-    html.P("Select Characteristics", className="text-muted small mb-4"),
-    html.Hr(),
-
-    html.Div([
-        html.Label("View by", className="form-label fw-bold mb-2"),
-        dcc.RadioItems(
-            id="date-field-selector",
-            options=[
-                {"label": " Enrollment Date", "value": "enrolldate"},
-                {"label": " Last Login Date", "value": "date_last_login"},
-            ],
-            value="enrolldate",
-            className="mb-3",
-            labelStyle={"display": "block", "margin-bottom": "5px"},
-        ),
-    ]),
-    html.Hr(),
-
-    html.Div([
-        html.Label("Academic Year", className="form-label fw-bold mb-2"),
-        dcc.Dropdown(id="year-dropdown", options=[], value=[], multi=True,
-                     placeholder="Select academic years...", className="mb-3"),
-    ]),
-    html.Div([
-        html.Label("Degree Type", className="form-label fw-bold mb-2"),
-        dcc.Dropdown(id="degreetype-dropdown",
-                     options=[{"label": d, "value": d} for d in degree_types],
-                     value=[], multi=True, placeholder="Select degree types...",
-                     className="mb-3"),
-    ]),
-    html.Div([
-        html.Label("Primary Field", className="form-label fw-bold mb-2"),
-        dcc.Dropdown(id="primary-field-dropdown",
-                     options=[{"label": f, "value": f} for f in primary_fields],
-                     value=[], multi=True, placeholder="Select fields...",
-                     className="mb-3"),
-    ]),
-    html.Div([
-        html.Label("Country", className="form-label fw-bold mb-2"),
-        dcc.Dropdown(id="country-dropdown",
-                     options=[{"label": c, "value": c} for c in countries],
-                     value=[], multi=True, placeholder="Select countries...",
-                     className="mb-3"),
-    ]),
-    html.Div([
-        html.Label("University Tier", className="form-label fw-bold mb-2"),
-        dcc.Dropdown(id="tier-dropdown",
-                     options=[{"label": f"Tier {int(t)}", "value": t} for t in tiers],
-                     value=[], multi=True, placeholder="Select tiers...",
-                     className="mb-3"),
-    ]),
-    html.Hr(),
-
-    html.Div([
-        dbc.Button("Clear All Filters", id="clear-filters-btn",
-                   color="outline-secondary", size="sm", className="mb-3"),
-    ]),
-    html.Div([
-        html.H6("Stats", className="text-primary mb-3"),
-        html.Div(id="filter-stats"),
-    ]),
-], style=SIDEBAR_STYLE)
-
-content = html.Div([
-    html.Div([
-        html.H1("EJM Applicant Registration Dashboard",
-                className="text-center mb-4",
-                style={"font-weight": "300", "letter-spacing": "2px"}),
-    ], className="mb-5"),
-    html.Div([
-        html.H3("Registration Overview", className="mb-3"),
-        html.Div(id="chart-subtitle", className="mb-2"),
-        dcc.Graph(id="registration-graph", style={"height": "70vh"}),
-    ]),
-], style=CONTENT_STYLE)
-
-footer = html.Div([
-    html.Div([
-        html.Img(
-            src="https://leap.unibocconi.eu/newsevents/one-post-doctoral-research-position-leap",
-            style={"height": "25px", "margin-right": "15px"},
-        ),
-        html.Span("\u00a9 Dhruva Devaraaj.", className="text-muted small"),
-    ], style={"display": "flex", "align-items": "center"}),
-], style=FOOTER_STYLE)
-
-app.layout = html.Div([sidebar, content, footer])
-
-# ==========================================================================
-# Callbacks
-# ==========================================================================
-
-@callback(
-    Output("year-dropdown", "options"),
-    [Input("date-field-selector", "value")],
-)
-def update_year_options(date_field):
-    years = academic_years if date_field == "enrolldate" else login_academic_years
-    return [{"label": f"{int(y)}-{int(y)+1}", "value": y} for y in years]
-
-
-@callback(
-    [Output("year-dropdown", "value"),
-     Output("degreetype-dropdown", "value"),
-     Output("primary-field-dropdown", "value"),
-     Output("country-dropdown", "value"),
-     Output("tier-dropdown", "value")],
-    [Input("clear-filters-btn", "n_clicks")],
-)
-def clear_filters(_):
-    return [], [], [], [], []
-
-
-@callback(
-    Output("filter-stats", "children"),
-    [Input("date-field-selector", "value"),
-     Input("year-dropdown", "value"),
-     Input("degreetype-dropdown", "value"),
-     Input("primary-field-dropdown", "value"),
-     Input("country-dropdown", "value"),
-     Input("tier-dropdown", "value")],
-)
-def update_filter_stats(date_field, sel_years, sel_degrees, sel_fields,
-                        sel_countries, sel_tiers):
-    filtered = filter_data(registration_data, sel_years, sel_degrees,
-                           sel_fields, sel_countries, sel_tiers, date_field)
-    year_col = DATE_FIELDS[date_field]["year_col"]
-    n = len(filtered)
-
-    elements = [
-        html.P([html.Strong("Total: "),
-                html.Span(f"{n:,}", className="text-success")], className="mb-2"),
-        html.P([html.Strong("% of Total: "),
-                html.Span(f"{n / total_registrations * 100:.1f}%",
-                          className="text-primary")], className="mb-2"),
-    ]
-
-    if sel_years:
-        years_to_show = sorted(sel_years, reverse=True)
-    elif len(filtered) > 0:
-        years_to_show = sorted(filtered[year_col].unique(), reverse=True)
-    else:
-        years_to_show = []
-
-    for year in years_to_show:
-        count = len(filtered[filtered[year_col] == year])
-        elements.append(
-            html.P([html.Strong(f"{int(year)}-{int(year)+1}: "),
-                    html.Span(f"{count:,}", className="text-info")],
-                   className="mb-1 small")
-        )
-
-    return elements
-
-
-@callback(
-    Output("chart-subtitle", "children"),
-    [Input("date-field-selector", "value")],
-)
-def update_chart_subtitle(date_field):
-    label = DATE_FIELDS[date_field]["label"].lower()
-    return html.P(f"Growth curve based on {label}", className="text-muted small")
-
-
-@callback(
-    Output("registration-graph", "figure"),
-    [Input("date-field-selector", "value"),
-     Input("year-dropdown", "value"),
-     Input("degreetype-dropdown", "value"),
-     Input("primary-field-dropdown", "value"),
-     Input("country-dropdown", "value"),
-     Input("tier-dropdown", "value")],
-)
-def update_graph(date_field, sel_years, sel_degrees, sel_fields,
-                 sel_countries, sel_tiers):
-    filtered = filter_data(registration_data, sel_years, sel_degrees,
-                           sel_fields, sel_countries, sel_tiers, date_field)
-    filtered = filtered.dropna(subset=[date_field])
-
-    if filtered.empty:
-        fig = go.Figure()
-        fig.update_layout(title="No data available for selected filters",
-                          xaxis_title="Time", yaxis_title="Cumulative Count")
-        return fig
-
-    year_col = DATE_FIELDS[date_field]["year_col"]
-    label = DATE_FIELDS[date_field]["label"]
-    years_to_show = sorted(sel_years if sel_years else filtered[year_col].unique())
-
-    fig = go.Figure(data=build_traces(filtered, date_field, year_col, years_to_show))
-
-    fig.update_layout(
-        title=make_title(label, sel_years),
-        xaxis_title="Timeline",
-        yaxis_title="Cumulative Count",
-        showlegend=True,
-        hovermode="x unified",
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        xaxis=academic_xaxis(),
-        yaxis=dict(showgrid=True, gridcolor="lightgray"),
-        height=600,
-    )
-
-    return fig
-
-# ==========================================================================
-# Server
-# ==========================================================================
-
-server = app.server
-
-if __name__ == "__main__":
-    app.run(debug=False, host="0.0.0.0", port=8050)
+import base64
+import os
+import time
+
+from dash import (Dash, html, dcc, Input, Output, State, callback, clientside_callback,
+                  no_update)
+import plotly.io as pio
+import pandas as pd
+import numpy as np
+import orjson
+import requests
+import dash_bootstrap_components as dbc
+from dash_bootstrap_templates import load_figure_template
+from flask import Flask
+from flask_caching import Cache
+
+# ==========================================================================
+# Constants
+# ==========================================================================
+
+API_URL = "https://support.econjobmarket.org/api/registrations"
+CUTOFF_DATE = "2021-06-01"
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Bump whenever load_data's output changes (columns, dtypes, index), so that
+# a fresh cache written by an older build is never read back.
+CACHE_SCHEMA_VERSION = 2
+CACHE_PATH = os.path.join(APP_DIR, f"registrations_cache.v{CACHE_SCHEMA_VERSION}.parquet")
+CACHE_TTL_SECONDS = 60 * 60
+# The memoized summaries are pickles, so they live in the app's own directory
+# rather than a predictable path under the shared temp dir.
+SUMMARY_CACHE_DIR = os.path.join(APP_DIR, "summary_cache")
+# Bump whenever summarize's output changes shape; it is part of every summary
+# cache key, so summaries pickled by an older build are never served.
+SUMMARY_FORMAT_VERSION = 1
+ACADEMIC_YEAR_START_MONTH = 6
+# Day offsets run from 0 (June 1) to 365 (May 31 before a leap day).
+ACADEMIC_YEAR_DAYS = 366
+
+ACADEMIC_MONTH_LABELS = [
+    "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+    "Jan", "Feb", "Mar", "Apr", "May",
+]
+ACADEMIC_MONTH_DAYS = [0, 30, 61, 92, 122, 153, 183, 214, 245, 273, 304, 334]
+
+TRACE_COLORS = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+]
+
+SIDEBAR_WIDTH = "18rem"
+
+# Low-cardinality filter columns, stored as pandas categoricals so that
+# filter_data's isin checks compare small integer codes instead of strings.
+CATEGORY_COLUMNS = ["degreetype", "primary_field", "country", "tier"]
+
+# The only API fields the dashboard reads; everything else is dropped on load.
+USED_COLUMNS = ["enrolldate", "date_last_login", *CATEGORY_COLUMNS]
+
+# Maps the date field radio button value to the corresponding year column,
+# precomputed day-offset column and display label. Used throughout callbacks
+# to avoid branching on enrolldate vs date_last_login everywhere.
+DATE_FIELDS = {
+    "enrolldate": {"year_col": "academic_year", "days_col": "enroll_academic_days",
+                   "label": "Enrollment Date"},
+    "date_last_login": {"year_col": "login_academic_year", "days_col": "login_academic_days",
+                        "label": "Last Login Date"},
+}
+
+# ==========================================================================
+# Data
+# ==========================================================================
+
+def get_academic_year(dates):
+    """Map a Series of calendar dates to int16 academic years (Jun-May cycle)."""
+    return (dates.dt.year - (dates.dt.month < ACADEMIC_YEAR_START_MONTH)).astype(np.int16)
+
+
+def date_to_academic_days(dates, academic_years):
+    """Days elapsed since June 1 of each date's academic year."""
+    starts = pd.to_datetime(pd.DataFrame({
+        "year": academic_years, "month": ACADEMIC_YEAR_START_MONTH, "day": 1,
+    }))
+    return (dates - starts).dt.days.astype(np.int16)
+
+
+def unique_sorted(series):
+    """Sorted unique non-null values from a pandas Series."""
+    return sorted(x for x in series.unique() if x is not None and not pd.isna(x))
+
+
+def categorize(df):
+    """Convert CATEGORY_COLUMNS to categoricals in place."""
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    return df
+
+
+def load_data():
+    r = requests.get(API_URL)
+    df = pd.DataFrame(orjson.loads(r.content))[USED_COLUMNS]
+
+    df["enrolldate"] = pd.to_datetime(df["enrolldate"])
+    df["date_last_login"] = pd.to_datetime(df["date_last_login"])
+
+    cutoff = pd.to_datetime(CUTOFF_DATE)
+    df = df[(df["enrolldate"] >= cutoff) & (df["date_last_login"] >= cutoff)]
+
+    categorize(df)
+
+    df["academic_year"] = get_academic_year(df["enrolldate"])
+    df["login_academic_year"] = get_academic_year(df["date_last_login"])
+
+    df["enroll_academic_days"] = date_to_academic_days(df["enrolldate"], df["academic_year"])
+    df["login_academic_days"] = date_to_academic_days(df["date_last_login"],
+                                                      df["login_academic_year"])
+
+    # Callbacks only read the year and day-offset columns derived above, so
+    # the raw datetimes would just be extra bytes in every row slice. The
+    # same goes for the int64 index the cutoff filter left behind; a
+    # RangeIndex costs nothing to store or slice.
+    return df.drop(columns=list(DATE_FIELDS)).reset_index(drop=True)
+
+
+def load_cached_data():
+    """Preprocessed registrations, refetched once the Parquet cache is stale.
+
+    Returns the frame together with the mtime of the cache file it came from,
+    which identifies the dataset in summary cache keys. Other workers may
+    replace CACHE_PATH at any moment, so the mtime is taken from the file
+    actually read or written, never by looking the path up again.
+    """
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            mtime = os.fstat(f.fileno()).st_mtime
+            if time.time() - mtime < CACHE_TTL_SECONDS:
+                # Parquet only round-trips string categoricals, so re-apply
+                # the conversion for numeric ones such as tier.
+                return categorize(pd.read_parquet(f, engine="pyarrow")), mtime
+    except FileNotFoundError:
+        pass
+
+    df = load_data()
+    # Write to a temp file first so concurrent workers never read a partial cache.
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+    mtime = os.stat(tmp_path).st_mtime
+    os.replace(tmp_path, CACHE_PATH)
+    return df, mtime
+
+
+# data_version identifies the loaded dataset in summary cache keys: that cache
+# is shared on disk by all workers, and must not serve summaries of an older
+# fetch once the Parquet cache has been refreshed.
+registration_data, data_version = load_cached_data()
+total_registrations = len(registration_data)
+
+primary_fields = unique_sorted(registration_data["primary_field"])
+countries = unique_sorted(registration_data["country"])
+tiers = unique_sorted(registration_data["tier"])
+degree_types = unique_sorted(registration_data["degreetype"])
+academic_years = unique_sorted(registration_data["academic_year"])
+login_academic_years = unique_sorted(registration_data["login_academic_year"])
+
+# Year dropdown options per date field; static, so built once here and
+# shipped to the browser with the layout.
+year_options = {
+    date_field: [{"label": f"{int(y)}-{int(y)+1}", "value": int(y)} for y in years]
+    for date_field, years in [("enrolldate", academic_years),
+                              ("date_last_login", login_academic_years)]
+}
+
+# Both date columns are cut off at CUTOFF_DATE, so no academic year precedes
+# the cutoff's; offsetting by it gives dense year codes for np.bincount.
+first_academic_year = int(get_academic_year(pd.Series([pd.Timestamp(CUTOFF_DATE)])).iloc[0])
+n_academic_years = (int(max(academic_years + login_academic_years, default=first_academic_year))
+                    - first_academic_year + 1)
+
+# ==========================================================================
+# Filtering and graph helpers
+# ==========================================================================
+
+def encode_int32(arr):
+    """Pack an integer array as base64 int32 bytes for storage in a dcc.Store.
+
+    The clientside graph callback decodes these as an Int32Array, so the
+    values are always converted to int32 here.
+    """
+    data = arr.astype(np.int32, copy=False).tobytes()
+    return {"bdata": base64.b64encode(data).decode("ascii")}
+
+
+def lookup_mask(codes, n_codes, allowed_codes):
+    """Equivalent of isin on integer codes in [0, n_codes), as a single gather.
+
+    Code -1 (a missing value) indexes an extra, always-False slot at the end
+    of the lookup table.
+    """
+    allowed_codes = np.asarray(allowed_codes)
+    lookup = np.zeros(n_codes + 1, dtype=bool)
+    lookup[allowed_codes[(allowed_codes >= 0) & (allowed_codes < n_codes)]] = True
+    return lookup[codes]
+
+
+def filter_data(data, selected_years, selected_degrees, selected_fields,
+                selected_countries, selected_tiers, date_field):
+    year_col = DATE_FIELDS[date_field]["year_col"]
+    mask = np.ones(len(data), dtype=bool)
+
+    if selected_years:
+        mask &= lookup_mask(data[year_col].to_numpy() - first_academic_year,
+                            n_academic_years,
+                            np.asarray(selected_years, dtype=int) - first_academic_year)
+
+    for values, col in [
+        (selected_degrees, "degreetype"),
+        (selected_fields, "primary_field"),
+        (selected_countries, "country"),
+        (selected_tiers, "tier"),
+    ]:
+        if values:
+            cat = data[col].cat
+            mask &= lookup_mask(cat.codes.to_numpy(), len(cat.categories),
+                                cat.categories.get_indexer(values))
+
+    # Without any active filter the full frame is returned as-is; callers
+    # only read from the result, so there is no need to copy it.
+    if mask.all():
+        return data
+    return data[mask]
+
+
+def summarize(filtered, date_field, selected_years):
+    """Per-year counts and cumulative curves for the filtered registrations.
+
+    Computed once per filter change and shared with the stats panel and the
+    graph through the filtered-store, so the result must be JSON-serializable.
+    """
+    year_col = DATE_FIELDS[date_field]["year_col"]
+    days_col = DATE_FIELDS[date_field]["days_col"]
+
+    # Day offsets are already integer bins, so a single bincount over
+    # (year, day) gives daily registrations for every year at once, and a
+    # cumsum along each row turns them into the cumulative curves.
+    codes = filtered[year_col].to_numpy().astype(np.intp) - first_academic_year
+    days = filtered[days_col].to_numpy()
+    daily = np.bincount(codes * ACADEMIC_YEAR_DAYS + days,
+                        minlength=n_academic_years * ACADEMIC_YEAR_DAYS)
+    daily = daily.reshape(n_academic_years, ACADEMIC_YEAR_DAYS)
+    cumulative = daily.cumsum(axis=1).astype(np.int32)
+    counts = cumulative[:, -1]
+
+    # Without a year selection, show every year that has registrations; the
+    # per-year totals already say which, in order, without a unique() + sort.
+    if selected_years:
+        years_to_show = sorted(int(y) for y in selected_years)
+    else:
+        years_to_show = (np.flatnonzero(counts) + first_academic_year).tolist()
+
+    # Each curve stops at its last day with a registration, so the current
+    # year doesn't run flat to the end of May. The x values are just the
+    # positions in the array and are not stored. Selected years come from the
+    # browser and may lie outside the loaded range, e.g. when the page was
+    # served by a worker with another fetch; they have no registrations here.
+    year_counts = []
+    curves = []
+    for year in years_to_show:
+        code = year - first_academic_year
+        if 0 <= code < n_academic_years:
+            active_days = np.flatnonzero(daily[code])
+            last_day = active_days[-1] + 1 if len(active_days) else 0
+            year_counts.append(int(counts[code]))
+            curves.append(encode_int32(cumulative[code, :last_day]))
+        else:
+            year_counts.append(0)
+            curves.append(encode_int32(cumulative[0, :0]))
+
+    return {
+        "title": make_title(DATE_FIELDS[date_field]["label"], selected_years),
+        "total": len(filtered),
+        "years": years_to_show,
+        "counts": year_counts,
+        "curves": curves,
+    }
+
+
+def make_title(label, selected_years):
+    base = f"Cumulative Count by {label}"
+    if not selected_years:
+        return f"{base} - All Years"
+    if len(selected_years) == 1:
+        y = selected_years[0]
+        return f"{base} - {int(y)}-{int(y)+1}"
+    return f"{base} - Selected Years"
+
+
+def academic_xaxis():
+    return dict(
+        tickmode="array",
+        tickvals=ACADEMIC_MONTH_DAYS,
+        ticktext=ACADEMIC_MONTH_LABELS,
+        showgrid=True,
+        gridcolor="lightgray",
+        range=[0, 365],
+    )
+
+# ==========================================================================
+# Layout
+# ==========================================================================
+
+SIDEBAR_STYLE = {
+    "position": "fixed", "top": 0, "left": 0, "bottom": 0,
+    "width": SIDEBAR_WIDTH, "padding": "2rem 1rem",
+    "background-color": "#f8f9fa", "border-right": "1px solid #dee2e6",
+    "overflow-y": "auto",
+}
+
+CONTENT_STYLE = {
+    "margin-left": SIDEBAR_WIDTH, "margin-right": "2rem",
+    "padding": "2rem 1rem", "padding-bottom": "4rem",
+}
+
+FOOTER_STYLE = {
+    "position": "fixed", "left": SIDEBAR_WIDTH, "right": 0, "bottom": 0,
+    "height": "3rem", "background-color": "#f8f9fa",
+    "border-top": "1px solid #dee2e6", "padding": "0.5rem 2rem",
+    "display": "flex", "align-items": "center", "justify-content": "center",
+}
+
+load_figure_template("LUX")
+# Figures are returned as plain dicts, which Plotly doesn't template, so the
+# theme is resolved once here and attached to each layout explicitly.
+figure_template = pio.templates[pio.templates.default].to_plotly_json()
+# Dash serializes callback responses through plotly.io.json; require orjson
+# there instead of silently falling back to the much slower stdlib encoder.
+pio.json.config.default_engine = "orjson"
+app_server = Flask(__name__)
+app = Dash(__name__, server=app_server, external_stylesheets=[dbc.themes.LUX])
+# On disk so that every gunicorn worker shares the memoized summaries.
+cache = Cache(app_server, config={
+    "CACHE_TYPE": "FileSystemCache",
+    "CACHE_DIR": SUMMARY_CACHE_DIR,
+    "CACHE_DEFAULT_TIMEOUT": CACHE_TTL_SECONDS,
+})
+
+sidebar = html.Div([
+    html.H4("FILTERS", className="text-primary mb-4"),
+    html.P("Select Characteristics", className="text-muted small mb-4"),
+    html.Hr(),
+
+    html.Div([
+        html.Label("View by", className="form-label fw-bold mb-2"),
+        dcc.RadioItems(
+            id="date-field-selector",
+            options=[
+                {"label": " Enrollment Date", "value": "enrolldate"},
+                {"label": " Last Login Date", "value": "date_last_login"},
+            ],
+            value="enrolldate",
+            className="mb-3",
+            labelStyle={"display": "block", "margin-bottom": "5px"},
+        ),
+    ]),
+    html.Hr(),
+
+    html.Div([
+        html.Label("Academic Year", className="form-label fw-bold mb-2"),
+        dcc.Dropdown(id="year-dropdown", options=[], value=[], multi=True,
+                     placeholder="Select academic years...", className="mb-3"),
+    ]),
+    html.Div([
+        html.Label("Degree Type", className="form-label fw-bold mb-2"),
+        dcc.Dropdown(id="degreetype-dropdown",
+                     options=[{"label": d, "value": d} for d in degree_types],
+                     value=[], multi=True, placeholder="Select degree types...",
+                     className="mb-3"),
+    ]),
+    html.Div([
+        html.Label("Primary Field", className="form-label fw-bold mb-2"),
+        dcc.Dropdown(id="primary-field-dropdown",
+                     options=[{"label": f, "value": f} for f in primary_fields],
+                     value=[], multi=True, placeholder="Select fields...",
+                     className="mb-3"),
+    ]),
+    html.Div([
+        html.Label("Country", className="form-label fw-bold mb-2"),
+        dcc.Dropdown(id="country-dropdown",
+                     options=[{"label": c, "value": c} for c in countries],
+                     value=[], multi=True, placeholder="Select countries...",
+                     className="mb-3"),
+    ]),
+    html.Div([
+        html.Label("University Tier", className="form-label fw-bold mb-2"),
+        dcc.Dropdown(id="tier-dropdown",
+                     options=[{"label": f"Tier {int(t)}", "value": t} for t in tiers],
+                     value=[], multi=True, placeholder="Select tiers...",
+                     className="mb-3"),
+    ]),
+    html.Hr(),
+
+    html.Div([
+        dbc.Button("Clear All Filters", id="clear-filters-btn",
+                   color="outline-secondary", size="sm", className="mb-3"),
+    ]),
+    html.Div([
+        html.H6("Stats", className="text-primary mb-3"),
+        html.Div(id="filter-stats"),
+    ]),
+], style=SIDEBAR_STYLE)
+
+content = html.Div([
+    html.Div([
+        html.H1("EJM Applicant Registration Dashboard",
+                className="text-center mb-4",
+                style={"font-weight": "300", "letter-spacing": "2px"}),
+    ], className="mb-5"),
+    html.Div([
+        html.H3("Registration Overview", className="mb-3"),
+        html.Div(html.P(id="chart-subtitle", className="text-muted small"),
+                 className="mb-2"),
+        dcc.Graph(id="registration-graph", style={"height": "70vh"}),
+    ]),
+], style=CONTENT_STYLE)
+
+footer = html.Div([
+    html.Div([
+        html.Img(
+            src="https://leap.unibocconi.eu/newsevents/one-post-doctoral-research-position-leap",
+            style={"height": "25px", "margin-right": "15px"},
+        ),
+        html.Span("\u00a9 Dhruva Devaraaj.", className="text-muted small"),
+    ], style={"display": "flex", "align-items": "center"}),
+], style=FOOTER_STYLE)
+
+# Static trace style and layouts for the clientside graph callback, sent once
+# with the page instead of with every figure.
+graph_config_store = dcc.Store(id="graph-config-store", data={
+    "colors": TRACE_COLORS,
+    "trace": {"type": "scattergl", "mode": "lines+markers", "marker": {"size": 4}},
+    "layout": {
+        "template": figure_template,
+        "showlegend": True,
+        "hovermode": "x unified",
+        "plot_bgcolor": "white",
+        "paper_bgcolor": "white",
+        "xaxis": {**academic_xaxis(), "title": {"text": "Timeline"}},
+        "yaxis": {"showgrid": True, "gridcolor": "lightgray",
+                  "title": {"text": "Cumulative Count"}},
+        "height": 600,
+    },
+    "empty_layout": {
+        "template": figure_template,
+        "title": {"text": "No data available for selected filters"},
+        "xaxis": {"title": {"text": "Time"}},
+        "yaxis": {"title": {"text": "Cumulative Count"}},
+    },
+})
+
+# Static per-date-field display data for the clientside callbacks.
+date_fields_store = dcc.Store(id="date-fields-store", data={
+    date_field: {"label": spec["label"], "year_options": year_options[date_field]}
+    for date_field, spec in DATE_FIELDS.items()
+})
+
+app.layout = html.Div([date_fields_store, graph_config_store,
+                       dcc.Store(id="filtered-store"), dcc.Store(id="filter-key-store"),
+                       sidebar, content, footer])
+
+# ==========================================================================
+# Callbacks
+# ==========================================================================
+
+# Switching the date field only swaps static labels and options, so these
+# run in the browser from the date-fields-store.
+clientside_callback(
+    "function(date_field, fields) { return fields[date_field].year_options; }",
+    Output("year-dropdown", "options"),
+    [Input("date-field-selector", "value")],
+    [State("date-fields-store", "data")],
+)
+
+
+clientside_callback(
+    """function(date_field, fields) {
+        return "Growth curve based on " + fields[date_field].label.toLowerCase();
+    }""",
+    Output("chart-subtitle", "children"),
+    [Input("date-field-selector", "value")],
+    [State("date-fields-store", "data")],
+)
+
+
+# Resetting the dropdowns needs no data, so it runs in the browser instead of
+# round-tripping to the server.
+clientside_callback(
+    "function(n_clicks) { return [[], [], [], [], []]; }",
+    [Output("year-dropdown", "value"),
+     Output("degreetype-dropdown", "value"),
+     Output("primary-field-dropdown", "value"),
+     Output("country-dropdown", "value"),
+     Output("tier-dropdown", "value")],
+    [Input("clear-filters-btn", "n_clicks")],
+)
+
+
+@callback(
+    [Output("filtered-store", "data"),
+     Output("filter-key-store", "data")],
+    [Input("date-field-selector", "value"),
+     Input("year-dropdown", "value"),
+     Input("degreetype-dropdown", "value"),
+     Input("primary-field-dropdown", "value"),
+     Input("country-dropdown", "value"),
+     Input("tier-dropdown", "value")],
+    [State("filter-key-store", "data")],
+)
+def update_filtered_store(date_field, sel_years, sel_degrees, sel_fields,
+                          sel_countries, sel_tiers, shown_key):
+    # Normalise the selections so the same filters hit the same cache entry
+    # regardless of the order they were picked in.
+    key = [date_field] + [
+        sorted(values or [])
+        for values in (sel_years, sel_degrees, sel_fields, sel_countries, sel_tiers)
+    ]
+
+    # Inputs often fire without changing the effective filters, e.g. Clear
+    # All Filters with nothing selected. Leave the store alone then, so the
+    # stats panel and graph don't re-render identical output.
+    if key == shown_key:
+        return no_update, no_update
+
+    summary = summarize_filters(date_field, *(tuple(v) for v in key[1:]))
+    return summary, key
+
+
+# Scoped to this build's summary format and the loaded dataset, so workers
+# never serve summaries of another build or fetch. FileSystemCache ignores
+# CACHE_KEY_PREFIX, so the scope goes into the memoized name instead.
+@cache.memoize(make_name=lambda name: f"v{SUMMARY_FORMAT_VERSION}-{data_version}-{name}")
+def summarize_filters(date_field, sel_years, sel_degrees, sel_fields,
+                      sel_countries, sel_tiers):
+    filtered = filter_data(registration_data, sel_years, sel_degrees,
+                           sel_fields, sel_countries, sel_tiers, date_field)
+    return summarize(filtered, date_field, sel_years)
+
+
+# Every page load starts from the unfiltered view of one of the date fields,
+# so precompute those summaries at startup instead of on the first request.
+for _date_field in DATE_FIELDS:
+    summarize_filters(_date_field, (), (), (), (), ())
+
+
+@callback(
+    Output("filter-stats", "children"),
+    [Input("filtered-store", "data")],
+)
+def update_filter_stats(summary):
+    n = summary["total"]
+
+    elements = [
+        html.P([html.Strong("Total: "),
+                html.Span(f"{n:,}", className="text-success")], className="mb-2"),
+        html.P([html.Strong("% of Total: "),
+                html.Span(f"{n / total_registrations * 100:.1f}%",
+                          className="text-primary")], className="mb-2"),
+    ]
+
+    for year, count in zip(reversed(summary["years"]), reversed(summary["counts"])):
+        elements.append(
+            html.P([html.Strong(f"{year}-{year+1}: "),
+                    html.Span(f"{count:,}", className="text-info")],
+                   className="mb-1 small")
+        )
+
+    return elements
+
+
+# The summary is already in the browser once the filtered-store updates, so
+# the figure is built there rather than in a second server round trip. Each
+# curve is the cumulative count per day offset, as base64 int32 bytes.
+clientside_callback(
+    """function(summary, config) {
+        if (!summary) {
+            return window.dash_clientside.no_update;
+        }
+        if (summary.total === 0) {
+            return {data: [], layout: config.empty_layout};
+        }
+
+        const data = [];
+        summary.years.forEach(function(year, i) {
+            const bytes = Uint8Array.from(atob(summary.curves[i].bdata),
+                                          function(c) { return c.charCodeAt(0); });
+            const cumcount = new Int32Array(bytes.buffer);
+            if (cumcount.length === 0) {
+                return;
+            }
+            data.push(Object.assign({}, config.trace, {
+                x: cumcount.map(function(_, day) { return day; }),
+                y: cumcount,
+                name: year + "-" + (year + 1),
+                line: {width: 2, color: config.colors[i % config.colors.length]},
+            }));
+        });
+
+        const layout = Object.assign({}, config.layout, {title: {text: summary.title}});
+        return {data: data, layout: layout};
+    }""",
+    Output("registration-graph", "figure"),
+    [Input("filtered-store", "data")],
+    [State("graph-config-store", "data")],
+)
+
+# ==========================================================================
+# Server
+# ==========================================================================
+
+server = app.server
+
+if __name__ == "__main__":
+    app.run(debug=False, host="0.0.0.0", port=8050)